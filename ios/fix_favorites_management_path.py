@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import re
 
+from pbxproj_utils import index_pbxproj
+
 project_path = 'PowderTracker/PowderTracker.xcodeproj/project.pbxproj'
 
 # Read the project file
@@ -23,27 +25,32 @@ if not favorites_uuid_match:
 favorites_uuid = favorites_uuid_match.group(1)
 print(f"Found FavoritesManagementView UUID: {favorites_uuid}")
 
+# Both edits only touch group children, so work on the PBXGroup section alone
+group_start, group_end = index_pbxproj(content)['PBXGroup']
+groups = content[group_start:group_end]
+
 # Remove from wrong Widget Views group (around line 221)
-# The pattern is: UUID /* FavoritesManagementView.swift */,\n in a children array
-wrong_ref_pattern = rf'\t\t\t\t{favorites_uuid} /\* FavoritesManagementView\.swift \*/,\n'
-content = re.sub(wrong_ref_pattern, '', content)
+# The entry is: UUID /* FavoritesManagementView.swift */,\n in a children array
+wrong_ref = f'\t\t\t\t{favorites_uuid} /* FavoritesManagementView.swift */,\n'
+groups = groups.replace(wrong_ref, '')
 print("Removed FavoritesManagementView from Widget Views group")
 
 # Add to correct Views group (FB275362EEA83C2D1C4035C1)
 # Find the line with MoreView.swift and add FavoritesManagementView after it
-more_view_pattern = r'(B8A56F458BB54E42B1B8B896 /\* MoreView\.swift \*/,\n)'
-more_view_match = re.search(more_view_pattern, content)
+more_view_anchor = 'B8A56F458BB54E42B1B8B896 /* MoreView.swift */,\n'
+more_view_pos = groups.find(more_view_anchor)
 
-if more_view_match:
-    insert_pos = more_view_match.end()
+if more_view_pos != -1:
+    insert_pos = more_view_pos + len(more_view_anchor)
     new_ref = f'\t\t\t\t{favorites_uuid} /* FavoritesManagementView.swift */,\n'
-    content = content[:insert_pos] + new_ref + content[insert_pos:]
+    groups = groups[:insert_pos] + new_ref + groups[insert_pos:]
     print("Added FavoritesManagementView to correct Views group")
 else:
     print("Error: Could not find MoreView.swift to insert after")
     exit(1)
 
 # Write back to file
+content = content[:group_start] + groups + content[group_end:]
 with open(project_path, 'w') as f:
     f.write(content)
 
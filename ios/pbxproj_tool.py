@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Data-driven tool for adding Swift files to the Xcode project.
+
+Each file is described by a dict with its path relative to ios/PowderTracker
+(e.g. 'PowderTracker/Views/Components/MountainLogoView.swift'). The group it
+lands in is resolved by walking the project's group tree along the file's
+directory, creating any missing groups on the way.
+
+One call reads the project once, indexes it once, applies every insertion in
+a single splice and writes it once.
+"""
+
+import os
+import re
+import secrets
+from pathlib import Path
+
+from pbxproj_utils import index_pbxproj, splice
+
+PROJECT_PATH = Path(__file__).resolve().parent / 'PowderTracker' / 'PowderTracker.xcodeproj' / 'project.pbxproj'
+
+GROUP_PATTERN = re.compile(
+    r'^\t\t(\w+)(?: /\* (.*?) \*/)? = \{\n\t\t\tisa = PBXGroup;\n\t\t\tchildren = \(\n(.*?)^\t\t\t\);\n(.*?)^\t\t\};$',
+    re.M | re.S
+)
+CHILD_PATTERN = re.compile(r'^\t\t\t\t(\w+) /\*', re.M)
+GROUP_PATH_PATTERN = re.compile(r'^\t\t\tpath = "?(.*?)"?;$', re.M)
+GROUP_NAME_PATTERN = re.compile(r'^\t\t\tname = "?(.*?)"?;$', re.M)
+MAIN_GROUP_PATTERN = re.compile(r'mainGroup = (\w+);')
+EXISTING_FILE_PATTERN = re.compile(r'/\* ([A-Za-z0-9_+]+\.swift) \*/')
+
+def generate_xcode_id():
+    """Generate a random 24-character hex ID like Xcode uses"""
+    return secrets.token_hex(12).upper()
+
+def read_project(project_path=PROJECT_PATH):
+    """Read the project file, returning both the raw bytes and decoded text"""
+    raw = Path(project_path).read_bytes()
+    return raw, raw.decode('utf-8')
+
+def write_project(content, project_path=PROJECT_PATH):
+    Path(project_path).write_bytes(content.encode('utf-8'))
+
+def build_index(content, target='PowderTracker'):
+    """
+    Index everything the add_* steps need from one pass over each section:
+    section offsets, the group tree and the target's Sources phase.
+    """
+    sections = index_pbxproj(content)
+
+    groups = {}
+    for match in GROUP_PATTERN.finditer(content, *sections['PBXGroup']):
+        group_path = GROUP_PATH_PATTERN.search(match.group(4))
+        group_name = GROUP_NAME_PATTERN.search(match.group(4))
+        groups[match.group(1)] = {
+            'name': group_name.group(1) if group_name else match.group(2),
+            'path': group_path.group(1) if group_path else None,
+            'children': CHILD_PATTERN.findall(match.group(3)),
+            'children_end': match.end(3),
+        }
+
+    # Map slash-separated group paths ('PowderTracker/Views') to group IDs.
+    # Only groups with a path = are folders on disk; name-only groups add
+    # nothing to their children's paths, so they are walked through and
+    # recorded separately so nothing is created that would shadow them.
+    group_paths = {}
+    virtual_groups = set()
+    main_group = MAIN_GROUP_PATTERN.search(content, *sections['PBXProject'])
+    pending = [(main_group.group(1), '')] if main_group else []
+    while pending:
+        group_id, prefix = pending.pop()
+        for child_id in groups[group_id]['children']:
+            child = groups.get(child_id)
+            if not child:
+                continue
+            if child['path']:
+                child_path = f"{prefix}{child['path']}"
+                group_paths[child_path] = child_id
+                pending.append((child_id, f'{child_path}/'))
+            else:
+                if child['name']:
+                    virtual_groups.add(f"{prefix}{child['name']}")
+                pending.append((child_id, prefix))
+
+    # The Sources phase listed in the target's buildPhases
+    sources_end = None
+    target_pattern = re.compile(
+        rf'^\t\t\w+ /\* {re.escape(target)} \*/ = {{\n\t\t\tisa = PBXNativeTarget;.*?buildPhases = \([^)]*?(\w+) /\* Sources \*/,',
+        re.M | re.S
+    )
+    target_match = target_pattern.search(content, *sections['PBXNativeTarget'])
+    if target_match:
+        phase_start = content.find(f'\t\t{target_match.group(1)} /* Sources */ = {{', *sections['PBXSourcesBuildPhase'])
+        if phase_start != -1:
+            files_start = content.index('files = (\n', phase_start)
+            sources_end = content.index('\t\t\t);', files_start)
+
+    return {
+        'sections': sections,
+        'groups': groups,
+        'group_paths': group_paths,
+        'virtual_groups': virtual_groups,
+        'sources_end': sources_end,
+    }
+
+def add_file_refs(index, files):
+    """PBXFileReference entries, appended to the end of their section"""
+    entries = ''.join(
+        f'\t\t{f["file_ref_id"]} /* {f["name"]} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = {f["name"]}; sourceTree = "<group>"; }};\n'
+        for f in files
+    )
+    for f in files:
+        print(f"+ Added PBXFileReference for {f['name']}")
+    return [(index['sections']['PBXFileReference'][1], entries)]
+
+def add_build_files(index, files):
+    """PBXBuildFile entries, appended to the end of their section"""
+    entries = ''.join(
+        f'\t\t{f["build_file_id"]} /* {f["name"]} in Sources */ = {{isa = PBXBuildFile; fileRef = {f["file_ref_id"]} /* {f["name"]} */; }};\n'
+        for f in files
+    )
+    for f in files:
+        print(f"+ Added PBXBuildFile for {f['name']}")
+    return [(index['sections']['PBXBuildFile'][1], entries)]
+
+def add_to_group(index, files):
+    """Append each file to its group's children, creating missing groups"""
+    insertions = []
+    group_paths = dict(index['group_paths'])
+    new_groups = {}  # group path -> (group id, [child entries])
+    existing_children = {}  # group id -> [child entries]
+
+    def resolve(group_path):
+        """Return the children list for group_path, creating it if needed"""
+        if group_path in new_groups:
+            return new_groups[group_path][1]
+        if group_path in group_paths:
+            return existing_children.setdefault(group_paths[group_path], [])
+
+        parent_path, _, dir_name = group_path.rpartition('/')
+        if not parent_path:
+            raise ValueError(f"Could not find group for {group_path}")
+        if group_path in index['virtual_groups']:
+            raise ValueError(
+                f"{group_path} is a group without a folder on disk; add files to it from Xcode"
+            )
+        group_id = generate_xcode_id()
+        resolve(parent_path).append(f'\t\t\t\t{group_id} /* {dir_name} */,\n')
+        new_groups[group_path] = (group_id, [])
+        print(f"+ Created {dir_name} group")
+        return new_groups[group_path][1]
+
+    for f in files:
+        resolve(os.path.dirname(f['path'])).append(f'\t\t\t\t{f["file_ref_id"]} /* {f["name"]} */,\n')
+        print(f"+ Added {f['name']} to {f['group']} group")
+
+    for group_id, children in existing_children.items():
+        insertions.append((index['groups'][group_id]['children_end'], ''.join(children)))
+
+    group_defs = []
+    for group_path, (group_id, children) in new_groups.items():
+        dir_name = group_path.rpartition('/')[2]
+        group_defs.append(
+            f'\t\t{group_id} /* {dir_name} */ = {{\n'
+            f'\t\t\tisa = PBXGroup;\n'
+            f'\t\t\tchildren = (\n'
+            f'{"".join(children)}'
+            f'\t\t\t);\n'
+            f'\t\t\tpath = {dir_name};\n'
+            f'\t\t\tsourceTree = "<group>";\n'
+            f'\t\t}};\n'
+        )
+    if group_defs:
+        insertions.append((index['sections']['PBXGroup'][1], ''.join(group_defs)))
+
+    return insertions
+
+def add_to_sources_phase(index, files):
+    """Append build files to the target's Sources build phase"""
+    if index['sources_end'] is None:
+        raise ValueError("Could not find the target's Sources build phase")
+    entries = ''.join(f'\t\t\t\t{f["build_file_id"]} /* {f["name"]} in Sources */,\n' for f in files)
+    for f in files:
+        print(f"+ Added {f['name']} to Sources build phase")
+    return [(index['sources_end'], entries)]
+
+def pbxproj_add(files_spec, project_path=PROJECT_PATH, target='PowderTracker', backup=False):
+    """Add every file in files_spec to the project in one read/index/splice/write pass"""
+    raw, content = read_project(project_path)
+    if backup:
+        backup_path = Path(project_path).with_suffix('.pbxproj.backup')
+        backup_path.write_bytes(raw)
+        print(f"✅ Created backup: {backup_path}")
+
+    # Collect the names already in the project once instead of rescanning per file
+    existing = set(EXISTING_FILE_PATTERN.findall(content))
+
+    files = []
+    for spec in files_spec:
+        name = spec.get('name') or os.path.basename(spec['path'])
+
+        # Check if file already exists in project
+        if name in existing:
+            print(f"✓ {name} already in project")
+            continue
+
+        files.append({
+            'name': name,
+            'path': spec['path'],
+            'group': os.path.basename(os.path.dirname(spec['path'])),
+            'file_ref_id': generate_xcode_id(),
+            'build_file_id': generate_xcode_id(),
+        })
+
+    if not files:
+        print("\nAll files already in project!")
+        return []
+
+    index = build_index(content, target)
+    # Resolve groups first so a file that can't be placed fails before anything is logged
+    group_insertions = add_to_group(index, files)
+    insertions = []
+    insertions += add_file_refs(index, files)
+    insertions += add_build_files(index, files)
+    insertions += group_insertions
+    insertions += add_to_sources_phase(index, files)
+
+    write_project(splice(content, insertions), project_path)
+    print(f"\n✅ Successfully added {len(files)} files to Xcode project")
+    return files
@@ -0,0 +1,40 @@
+"""
+Shared helpers for editing project.pbxproj from the add_*.py scripts
+"""
+
+BEGIN_MARKER = '/* Begin '
+END_MARKER = '/* End '
+SECTION_SUFFIX = ' section */'
+
+def index_pbxproj(content):
+    """
+    Map each section name to its (start, end) offsets in a single linear scan.
+
+    start is just past the "/* Begin X section */" line and end is the offset of
+    the "/* End X section */" marker, so content[start:end] holds the section's
+    entries and splicing at end appends to the section.
+    """
+    index = {}
+    pos = content.find(BEGIN_MARKER)
+    while pos != -1:
+        name_start = pos + len(BEGIN_MARKER)
+        name_end = content.index(SECTION_SUFFIX, name_start)
+        name = content[name_start:name_end]
+
+        start = content.index('\n', name_end) + 1
+        end = content.index(f'{END_MARKER}{name}{SECTION_SUFFIX}', start)
+        index[name] = (start, end)
+
+        pos = content.find(BEGIN_MARKER, end)
+    return index
+
+def splice(content, insertions):
+    """Apply (offset, text) insertions, all relative to the original content, in one copy"""
+    pieces = []
+    last = 0
+    for pos, text in sorted(insertions, key=lambda insertion: insertion[0]):
+        pieces.append(content[last:pos])
+        pieces.append(text)
+        last = pos
+    pieces.append(content[last:])
+    return ''.join(pieces)
@@ -5,13 +5,33 @@ Queries aerialway-tagged ways within 5km of each mountain's coordinates.
 Outputs GeoJSON files matching the existing S3 format.
 """
 
-import json
+import asyncio
 import os
-import time
-import urllib.request
-import urllib.error
+import random
+import re
+
+import aiohttp
+import orjson
+
+try:
+    import geobuf
+except ImportError:  # geobuf is optional; only the .geojson files are written without it
+    geobuf = None
 
 OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+OVERPASS_STATUS_URL = "https://overpass-api.de/api/status"
+
+# Overpass grants each client a few query slots; never keep more than this in flight
+MAX_CONCURRENT = 4
+MAX_RETRIES = 5
+RETRY_STATUSES = {429, 504}
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+# Used when /api/status can't be read and none of our queries are running:
+# one query at a time, 1.5s apart
+FALLBACK_WAIT = 1.5
+# Empty /api/status polls in a row before falling back to FALLBACK_WAIT pacing
+MAX_EMPTY_POLLS = 10
 
 # All mountains with coordinates from packages/shared/src/config/mountains.ts
 MOUNTAINS = {
@@ -84,63 +104,155 @@ MOUNTAINS = {
 SKIP_TYPES = {"station", "zip_line", "goods", "pylon"}
 
 
-def query_overpass(lat, lng, radius=5000):
+class OverpassSlots:
+    """
+    Token bucket refilled from Overpass's /api/status: one token per query slot
+    the server says is free now. When the bucket is empty, it waits until the
+    soonest slot the status page announces, or until one of our own in-flight
+    queries finishes, then asks again.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.tokens = 0
+        self.in_flight = 0
+        self.wait = FALLBACK_WAIT
+        self.fallback = False
+        self.lock = asyncio.Lock()
+        self.released = asyncio.Condition(self.lock)
+
+    async def refresh(self):
+        self.fallback = False
+        try:
+            async with self.session.get(OVERPASS_STATUS_URL) as resp:
+                resp.raise_for_status()
+                status = await resp.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            status = ""
+
+        rate_limit = re.search(r"^Rate limit: (\d+)", status, re.M)
+        available = re.search(r"^(\d+) slots? available now", status, re.M)
+        waits = [int(seconds) for seconds in re.findall(r"in (-?\d+) seconds", status)]
+
+        if rate_limit and rate_limit.group(1) == "0":
+            # No rate limit on this instance; MAX_CONCURRENT still caps concurrency
+            self.tokens = MAX_CONCURRENT
+        elif available and int(available.group(1)) > 0:
+            self.tokens = int(available.group(1))
+        elif waits:
+            self.tokens, self.wait = 0, max(min(waits), 0) + 0.5
+        elif self.in_flight:
+            # No free slot and no announced release time, but our own queries
+            # hold slots: wait for one of them to finish
+            self.tokens, self.wait = 0, None
+        else:
+            # Nothing we can wait on (unreadable or unknown status page), so don't
+            # poll forever: pace queries and let 429 backoff handle a busy server
+            self.use_fallback()
+
+    def use_fallback(self):
+        self.tokens, self.wait, self.fallback = 1, FALLBACK_WAIT, True
+
+    async def acquire(self):
+        async with self.lock:
+            empty_polls = 0
+            while self.tokens == 0:
+                await self.refresh()
+                if self.tokens:
+                    break
+                empty_polls += 1
+                if empty_polls >= MAX_EMPTY_POLLS and not self.in_flight:
+                    self.use_fallback()
+                    break
+                try:
+                    await asyncio.wait_for(self.released.wait(), self.wait)
+                except asyncio.TimeoutError:
+                    pass
+            self.tokens -= 1
+            self.in_flight += 1
+            if self.fallback:
+                # Hold the lock so fallback queries go out one at a time, spaced
+                await asyncio.sleep(self.wait)
+
+    async def release(self):
+        """One of our queries finished; wake a waiter to re-read the status page."""
+        async with self.lock:
+            self.in_flight -= 1
+            self.released.notify()
+
+    def exhausted(self):
+        """The server rejected a query, so the slot count we had is stale."""
+        self.tokens = 0
+
+
+async def query_overpass(session, slots, semaphore, lat, lng, radius=5000):
     """Query Overpass API for aerialway ways near a point."""
+    # Nodes are output before the ways that reference them so the response
+    # can be converted in a single pass
     query = f"""
     [out:json][timeout:30];
-    way["aerialway"](around:{radius},{lat},{lng});
-    out body;
-    >;
+    way["aerialway"](around:{radius},{lat},{lng})->.lifts;
+    node(w.lifts);
     out skel qt;
+    .lifts out body;
     """
-    data = urllib.request.urlopen(
-        urllib.request.Request(
-            OVERPASS_URL,
-            data=f"data={urllib.parse.quote(query)}".encode(),
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        ),
-        timeout=60,
-    ).read()
-    return json.loads(data)
+    for attempt in range(MAX_RETRIES):
+        async with semaphore:
+            await slots.acquire()
+            try:
+                async with session.post(OVERPASS_URL, data={"data": query}) as resp:
+                    if resp.status not in RETRY_STATUSES:
+                        resp.raise_for_status()
+                        return orjson.loads(await resp.read())
+                    retry_after = resp.headers.get("Retry-After")
+                    slots.exhausted()
+            finally:
+                await slots.release()
+
+        # Back off exponentially with full jitter unless the server says how long to wait
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+        await asyncio.sleep(delay)
+
+    raise RuntimeError(f"Overpass still busy after {MAX_RETRIES} attempts")
 
 
 def overpass_to_geojson(mountain_id, mountain_name, overpass_data):
     """Convert Overpass JSON to GeoJSON FeatureCollection matching existing format."""
-    nodes = {}
-    for elem in overpass_data.get("elements", []):
-        if elem["type"] == "node":
-            nodes[elem["id"]] = (elem["lat"], elem["lon"])
-
+    nodes = {}  # node id -> (lon, lat), GeoJSON order
     features = []
     for elem in overpass_data.get("elements", []):
-        if elem["type"] != "way":
+        elem_type = elem["type"]
+        if elem_type == "node":
+            nodes[elem["id"]] = (elem["lon"], elem["lat"])
             continue
-        tags = elem.get("tags", {})
-        aerialway_type = tags.get("aerialway", "")
-        if aerialway_type in SKIP_TYPES or not aerialway_type:
+        if elem_type != "way":
             continue
 
-        coords = []
-        for node_id in elem.get("nodes", []):
-            if node_id in nodes:
-                lat, lon = nodes[node_id]
-                coords.append([lon, lat])  # GeoJSON is [lng, lat]
+        get_tag = elem.get("tags", {}).get
+        aerialway_type = get_tag("aerialway", "")
+        if aerialway_type in SKIP_TYPES or not aerialway_type:
+            continue
 
+        coords = [[*nodes[node_id]] for node_id in elem.get("nodes", []) if node_id in nodes]
         if not coords:
             continue
 
+        way_id = elem["id"]
         features.append({
             "type": "Feature",
             "geometry": {"type": "LineString", "coordinates": coords},
             "properties": {
-                "id": str(elem["id"]),
+                "id": str(way_id),
                 "type": aerialway_type,
-                "name": tags.get("name", f"Lift {elem['id']}"),
-                "occupancy": tags.get("aerialway:occupancy"),
-                "capacity": tags.get("aerialway:capacity"),
-                "duration": tags.get("aerialway:duration"),
-                "heating": tags.get("aerialway:heating"),
-                "bubble": tags.get("aerialway:bubble"),
+                "name": get_tag("name", f"Lift {way_id}"),
+                "occupancy": get_tag("aerialway:occupancy"),
+                "capacity": get_tag("aerialway:capacity"),
+                "duration": get_tag("aerialway:duration"),
+                "heating": get_tag("aerialway:heating"),
+                "bubble": get_tag("aerialway:bubble"),
             },
         })
 
@@ -155,38 +267,51 @@ def overpass_to_geojson(mountain_id, mountain_name, overpass_data):
     }
 
 
-def main():
-    import urllib.parse
+async def fetch_mountain(session, slots, semaphore, mid, mtn, output_dir):
+    """Fetch one mountain's lifts and write its GeoJSON. Returns the lift count, or -1 on error."""
+    try:
+        data = await query_overpass(session, slots, semaphore, mtn["lat"], mtn["lng"])
+        geojson = overpass_to_geojson(mid, mtn["name"], data)
+        count = geojson["properties"]["lift_count"]
+
+        if count > 0:
+            path = os.path.join(output_dir, f"{mid}.geojson")
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(geojson))
+            if geobuf is not None:
+                with open(f"{path}.pbf", "wb") as f:
+                    f.write(geobuf.encode(geojson, 6, 2))  # 6 decimal places, 2D
+            print(f"{mid} ({mtn['name']}): {count} lifts")
+        else:
+            print(f"{mid} ({mtn['name']}): 0 lifts (skipped)")
+
+        return count
+    except Exception as e:
+        print(f"{mid} ({mtn['name']}): ERROR: {e}")
+        return -1
 
+
+async def main():
     output_dir = os.path.join(os.path.dirname(__file__), "..", "public", "lifts")
     os.makedirs(output_dir, exist_ok=True)
 
-    results = {}
     total = len(MOUNTAINS)
+    print(f"Fetching lifts for {total} mountains...")
 
-    for i, (mid, mtn) in enumerate(MOUNTAINS.items(), 1):
-        print(f"[{i}/{total}] {mid} ({mtn['name']})...", end=" ", flush=True)
-        try:
-            data = query_overpass(mtn["lat"], mtn["lng"])
-            geojson = overpass_to_geojson(mid, mtn["name"], data)
-            count = geojson["properties"]["lift_count"]
-
-            if count > 0:
-                path = os.path.join(output_dir, f"{mid}.geojson")
-                with open(path, "w") as f:
-                    json.dump(geojson, f, indent=2)
-                print(f"{count} lifts")
-            else:
-                print("0 lifts (skipped)")
-
-            results[mid] = count
-        except Exception as e:
-            print(f"ERROR: {e}")
-            results[mid] = -1
-
-        # Rate limit: Overpass API asks for 1 req/sec
-        if i < total:
-            time.sleep(1.5)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    timeout = aiohttp.ClientTimeout(total=60)
+    # Pool one keep-alive connection per in-flight query so the TCP/TLS handshake
+    # with overpass-api.de is paid once per connection, not once per mountain
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT, keepalive_timeout=60)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # Rate limit: follow the query slots Overpass grants this client
+        slots = OverpassSlots(session)
+        counts = await asyncio.gather(*(
+            fetch_mountain(session, slots, semaphore, mid, mtn, output_dir)
+            for mid, mtn in MOUNTAINS.items()
+        ))
+    results = dict(zip(MOUNTAINS, counts))
 
     # Summary
     print("\n=== Summary ===")
@@ -203,4 +328,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -13,79 +13,361 @@ Example:
 """
 
 import argparse
-import json
-import math
+import gzip
+import heapq
+import io
 import os
+import shutil
+import subprocess
 from pathlib import Path
-from typing import List, Tuple
-
-from PIL import Image, ImageDraw
-
-
-def lon_lat_to_tile(lon: float, lat: float, zoom: int) -> Tuple[int, int]:
-    """Convert longitude/latitude to tile coordinates at given zoom level."""
-    lat_rad = math.radians(lat)
-    n = 2.0 ** zoom
-    x = int((lon + 180.0) / 360.0 * n)
-    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
-    return x, y
-
-
-def tile_to_lon_lat(x: int, y: int, zoom: int) -> Tuple[float, float]:
-    """Convert tile coordinates to longitude/latitude (NW corner)."""
-    n = 2.0 ** zoom
-    lon = x / n * 360.0 - 180.0
-    lat_rad = math.atan(math.sinh(math.pi * (1 - 2 * y / n)))
-    lat = math.degrees(lat_rad)
-    return lon, lat
-
-
-def lon_lat_to_pixel(lon: float, lat: float, zoom: int, tile_x: int, tile_y: int, tile_size: int = 256) -> Tuple[int, int]:
-    """Convert lon/lat to pixel coordinates within a specific tile."""
-    # Get the lon/lat of the NW corner of this tile
-    tile_lon, tile_lat = tile_to_lon_lat(tile_x, tile_y, zoom)
-    tile_lon_next, tile_lat_next = tile_to_lon_lat(tile_x + 1, tile_y + 1, zoom)
-
-    # Calculate pixel position within tile
-    lon_range = tile_lon_next - tile_lon
-    lat_range = tile_lat_next - tile_lat
-
-    px = int((lon - tile_lon) / lon_range * tile_size)
-    py = int((lat - tile_lat) / lat_range * tile_size)
-
-    return px, py
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+import orjson
+from PIL import Image, ImageColor, ImageDraw
+
+try:
+    import skia
+except ImportError:  # only needed for --renderer skia
+    skia = None
+
+try:
+    from blake3 import blake3 as tile_hash
+except ImportError:  # blake3 is optional; hashlib's BLAKE2 is used without it
+    from hashlib import blake2b as tile_hash
+
+try:
+    import mapbox_vector_tile
+except ImportError:  # only needed for --format mvt
+    mapbox_vector_tile = None
+
+# Written into a zoom directory once all of its tiles are on disk, so a tile
+# missing from it is known to be empty (see the tiles API route)
+ZOOM_COMPLETE_MARKER = '.{}-complete'
+
+# Vertices whose Visvalingam effective area is below this many square pixels at
+# a zoom level are dropped before drawing that zoom
+SIMPLIFY_AREA = 1.0
+
+# Vector tile lines are clipped this many pixels outside the tile, so clients
+# don't draw seams or line caps at tile edges
+MVT_BUFFER = 8
+
+LIFT_COLORS = {
+    'gondola': '#FF0000',
+    'cable_car': '#FF0000',
+    'chair_lift': '#0066FF',
+    'drag_lift': '#00CC00',
+    't-bar': '#00CC00',
+    'j-bar': '#00CC00',
+    'platter': '#00CC00',
+    'magic_carpet': '#9933FF',
+    'rope_tow': '#00CC00',
+}
+DEFAULT_LIFT_COLOR = '#888888'
+
+# Line width by zoom level: 1px up to z11, 2px to z13, 3px to z15, 4px beyond
+LIFT_WIDTHS = [1] * 12 + [2, 2] + [3, 3] + [4]
+
+# Pillow tiles are palette PNGs: index 0 is transparent, then one entry per lift color
+TILE_PALETTE = ['#000000'] + sorted(set(LIFT_COLORS.values()) | {DEFAULT_LIFT_COLOR})
+PALETTE_INDEX = {color: i for i, color in enumerate(TILE_PALETTE)}
+
+
+def lon_lat_to_mercator(coords: np.ndarray) -> np.ndarray:
+    """Project an (N, 2) array of longitude/latitude to normalized Web Mercator x/y in [0, 1]."""
+    merc = np.empty(coords.shape, dtype=np.float64)
+    merc[:, 0] = (coords[:, 0] + 180.0) / 360.0
+    merc[:, 1] = (1.0 - np.arcsinh(np.tan(np.radians(coords[:, 1]))) / np.pi) / 2.0
+    return merc
+
+
+def world_size(zoom: int, tile_size: int = 256) -> int:
+    """Width and height in pixels of the whole map at a zoom level."""
+    return tile_size << zoom
+
+
+def visvalingam_areas(points: np.ndarray) -> np.ndarray:
+    """
+    Effective area of each vertex of a polyline under Visvalingam-Whyatt
+    simplification. Endpoints get infinity so they are always kept.
+    """
+    n = len(points)
+    areas = np.full(n, np.inf)
+    if n < 3:
+        return areas
+
+    pts = points.tolist()
+    prev = list(range(-1, n - 1))
+    next_ = list(range(1, n + 1))
+
+    def triangle_area(i):
+        (ax, ay), (bx, by), (cx, cy) = pts[prev[i]], pts[i], pts[next_[i]]
+        return abs((bx - ax) * (cy - ay) - (cx - ax) * (by - ay)) / 2.0
+
+    current = [0.0] * n
+    heap = []
+    for i in range(1, n - 1):
+        current[i] = triangle_area(i)
+        heap.append((current[i], i))
+    heapq.heapify(heap)
+
+    # Repeatedly remove the least significant vertex, recomputing its neighbours.
+    # A vertex never gets a smaller area than one removed before it.
+    removed = [False] * n
+    max_area = 0.0
+    while heap:
+        area, i = heapq.heappop(heap)
+        if removed[i] or area != current[i]:
+            continue
+        removed[i] = True
+        max_area = max(max_area, area)
+        areas[i] = max_area
+
+        p, q = prev[i], next_[i]
+        next_[p], prev[q] = q, p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                current[j] = triangle_area(j)
+                heapq.heappush(heap, (current[j], j))
+
+    return areas
+
+
+def segment_tiles(x0: float, y0: float, x1: float, y1: float, tile_size: int, margin: float):
+    """
+    Yield the tiles a segment (in world pixels) passes through, walking the tile
+    grid one row at a time. margin widens the segment so thick lines also reach
+    the neighbouring tiles they spill into.
+    """
+    if y0 > y1:
+        x0, y0, x1, y1 = x1, y1, x0, y0
+
+    for tile_y in range(int((y0 - margin) // tile_size), int((y1 + margin) // tile_size) + 1):
+        # x extent of the part of the segment inside this tile row
+        if y1 == y0:
+            xa, xb = x0, x1
+        else:
+            dx_dy = (x1 - x0) / (y1 - y0)
+            xa = x0 + (max(y0, tile_y * tile_size - margin) - y0) * dx_dy
+            xb = x0 + (min(y1, (tile_y + 1) * tile_size + margin) - y0) * dx_dy
+
+        for tile_x in range(int((min(xa, xb) - margin) // tile_size), int((max(xa, xb) + margin) // tile_size) + 1):
+            yield tile_x, tile_y
+
+
+def clip_polyline(pixels: list, xmin: float, ymin: float, xmax: float, ymax: float) -> list:
+    """
+    Clip a flat [x0, y0, x1, y1, ...] polyline to a box with Liang-Barsky,
+    segment by segment, returning the flat pieces that lie inside it.
+    """
+    pieces = []
+    piece = None
+    for k in range(0, len(pixels) - 2, 2):
+        x0, y0, x1, y1 = pixels[k:k + 4]
+        dx, dy = x1 - x0, y1 - y0
+        t0, t1 = 0.0, 1.0
+        for p, q in ((-dx, x0 - xmin), (dx, xmax - x0), (-dy, y0 - ymin), (dy, ymax - y0)):
+            if p == 0:
+                if q < 0:
+                    break
+            elif p < 0:
+                t0 = max(t0, q / p)
+            else:
+                t1 = min(t1, q / p)
+            if t0 > t1:
+                break
+        else:
+            # Start a new piece where the line (re-)enters the box
+            if piece is None or t0 > 0:
+                piece = [x0 + t0 * dx, y0 + t0 * dy]
+                pieces.append(piece)
+            piece += [x0 + t1 * dx, y0 + t1 * dy]
+            if t1 < 1:
+                piece = None
+            continue
+        piece = None
+
+    # Drop pieces that only touch the box at a point
+    return [piece for piece in pieces if piece[:2] != piece[-2:] or len(piece) > 4]
 
 
 def get_lift_color(lift_type: str) -> str:
     """Get color for lift type."""
-    colors = {
-        'gondola': '#FF0000',
-        'cable_car': '#FF0000',
-        'chair_lift': '#0066FF',
-        'drag_lift': '#00CC00',
-        't-bar': '#00CC00',
-        'j-bar': '#00CC00',
-        'platter': '#00CC00',
-        'magic_carpet': '#9933FF',
-        'rope_tow': '#00CC00',
-    }
-    return colors.get(lift_type, '#888888')
+    return LIFT_COLORS.get(lift_type, DEFAULT_LIFT_COLOR)
 
 
 def get_lift_width(zoom: int) -> int:
     """Get line width based on zoom level."""
-    if zoom <= 11:
-        return 1
-    elif zoom <= 13:
-        return 2
-    elif zoom <= 15:
-        return 3
-    else:
-        return 4
-
-
-def generate_tiles(mountain_id: str, zoom_min: int = 10, zoom_max: int = 16, tile_size: int = 256):
+    return LIFT_WIDTHS[min(zoom, len(LIFT_WIDTHS) - 1)]
+
+
+def draw_tile_skia(lines: list, tile_size: int, line_width: int) -> Optional[bytes]:
+    """
+    Draw one tile's (color, pixels) polylines with Skia, returning the encoded
+    PNG, or None if nothing landed inside the tile.
+    """
+    surface = skia.Surface(tile_size, tile_size)
+    canvas = surface.getCanvas()
+    canvas.clear(skia.ColorTRANSPARENT)
+
+    # One path per color, so each tile is a handful of draw calls
+    paths = {}
+    for color, pixels in lines:
+        path = paths.setdefault(color, skia.Path())
+        # Integer pixel coordinates are pixel centers, as in Pillow
+        path.moveTo(pixels[0] + 0.5, pixels[1] + 0.5)
+        for k in range(2, len(pixels), 2):
+            path.lineTo(pixels[k] + 0.5, pixels[k + 1] + 0.5)
+
+    for color, path in paths.items():
+        paint = skia.Paint(
+            AntiAlias=True,
+            Style=skia.Paint.kStroke_Style,
+            StrokeWidth=line_width,
+            Color=skia.Color(*ImageColor.getrgb(color)),
+        )
+        canvas.drawPath(path, paint)
+
+    if not surface.toarray()[..., 3].any():
+        return None
+
+    return bytes(surface.makeImageSnapshot().encodeToData(skia.EncodedImageFormat.kPNG, 100))
+
+
+def write_tiles(tiles: list, links: list = ()):
+    """
+    Write encoded (path, data) tiles with a single os.open/os.write/os.close
+    each, once a whole column has been encoded in memory, then hard link the
+    (source, path) duplicates. Every file is created under a temporary name in
+    its directory and renamed into place, so runs writing the same tiles at
+    once, and readers, never see a missing or half-written tile.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    suffix = f'.{os.getpid()}.tmp'
+    for path, data in tiles:
+        tmp_path = f'{path}{suffix}'
+        # Left over from a crashed run with the same PID
+        if os.path.lexists(tmp_path):
+            os.unlink(tmp_path)
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+
+    for source, path in links:
+        tmp_path = f'{path}{suffix}'
+        if os.path.lexists(tmp_path):
+            os.unlink(tmp_path)
+        os.link(source, tmp_path)
+        os.replace(tmp_path, path)
+
+
+def render_tile_column(x_dir: Path, lines: dict, tile_size: int, line_width: int,
+                       renderer: str = 'pillow') -> int:
+    """
+    Draw and save the non-empty tiles of one column. lines maps tile_y to the
+    (color, pixels) polylines to draw in that tile. Tiles with the same pixels
+    as one already written are hard linked to it. Runs in a worker process.
+    """
+    x_dir.mkdir(exist_ok=True)
+
+    tiles = []
+    links = []
+    seen = {}  # pixel digest -> path of the first tile with those pixels
+    for tile_y, tile_lines in sorted(lines.items()):
+        tile_path = x_dir / f'{tile_y}.png'
+        if renderer == 'skia':
+            data = draw_tile_skia(tile_lines, tile_size, line_width)
+            if data is None:
+                continue
+            digest = tile_hash(data).digest()
+        else:
+            # Create transparent palette image
+            img = Image.new('P', (tile_size, tile_size), 0)
+            img.putpalette([channel for color in TILE_PALETTE for channel in ImageColor.getrgb(color)])
+            draw = ImageDraw.Draw(img)
+
+            # Draw each lift that intersects this tile
+            for color, pixels in tile_lines:
+                draw.line(pixels, fill=PALETTE_INDEX[color], width=line_width)
+
+            # Nothing landed inside the tile
+            if img.getbbox() is None:
+                continue
+
+            digest = tile_hash(img.tobytes()).digest()
+            if digest not in seen:
+                # Encode tile
+                buffer = io.BytesIO()
+                img.save(buffer, 'PNG', transparency=0)
+                data = buffer.getbuffer()
+
+        if digest in seen:
+            links.append((seen[digest], tile_path))
+            continue
+        seen[digest] = tile_path
+        tiles.append((tile_path, data))
+
+    write_tiles(tiles, links)
+    return len(tiles) + len(links)
+
+
+def render_vector_column(x_dir: Path, lines: dict, tile_size: int) -> int:
+    """
+    Encode and save the non-empty tiles of one column as gzipped Mapbox Vector
+    Tiles. lines maps tile_y to the (properties, pixels) lines in that tile, in
+    pixels relative to the tile's NW corner. Lines are clipped to MVT_BUFFER
+    pixels around the tile. Runs in a worker process.
+    """
+    x_dir.mkdir(exist_ok=True)
+
+    bounds = (-MVT_BUFFER, -MVT_BUFFER, tile_size + MVT_BUFFER, tile_size + MVT_BUFFER)
+    options = {'quantize_bounds': (0, 0, tile_size, tile_size), 'y_coord_down': True}
+    tiles = []
+    for tile_y, features in lines.items():
+        features = [
+            (properties, piece)
+            for properties, pixels in features
+            for piece in clip_polyline(pixels, *bounds)
+        ]
+        if not features:
+            continue
+        layer = {
+            'name': 'lifts',
+            'features': [
+                {
+                    'geometry': 'LINESTRING (' + ', '.join(
+                        f'{pixels[k]:.2f} {pixels[k + 1]:.2f}' for k in range(0, len(pixels), 2)
+                    ) + ')',
+                    'properties': properties,
+                }
+                for properties, pixels in features
+            ],
+        }
+        tile = mapbox_vector_tile.encode([layer], default_options=options)
+        tiles.append((x_dir / f'{tile_y}.mvt.gz', gzip.compress(tile)))
+
+    write_tiles(tiles)
+    return len(tiles)
+
+
+def generate_tiles(mountain_id: str, zoom_min: int = 10, zoom_max: int = 16, tile_size: int = 256,
+                   workers: Optional[int] = None, tile_format: str = 'png', oxipng: bool = False,
+                   renderer: str = 'pillow'):
     """Generate tiles for a mountain's lifts."""
+    if tile_format == 'mvt' and mapbox_vector_tile is None:
+        print("Error: --format mvt requires mapbox-vector-tile (pip install mapbox-vector-tile)")
+        return
+    if tile_format == 'png' and renderer == 'skia' and skia is None:
+        print("Error: --renderer skia requires skia-python (pip install skia-python)")
+        return
 
     # Read GeoJSON file
     geojson_path = Path(__file__).parent.parent / 'data' / 'ski-lifts' / 'geojson' / f'{mountain_id}.geojson'
@@ -93,8 +375,7 @@ def generate_tiles(mountain_id: str, zoom_min: int = 10, zoom_max: int = 16, til
         print(f"Error: GeoJSON file not found: {geojson_path}")
         return
 
-    with open(geojson_path, 'r') as f:
-        geojson = json.load(f)
+    geojson = orjson.loads(geojson_path.read_bytes())
 
     print(f"Loaded {len(geojson['features'])} lifts for {mountain_id}")
 
@@ -102,80 +383,137 @@ def generate_tiles(mountain_id: str, zoom_min: int = 10, zoom_max: int = 16, til
     output_dir = Path(__file__).parent.parent / 'public' / 'tiles' / mountain_id
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Calculate bounding box to determine which tiles we need
-    all_coords = []
-    for feature in geojson['features']:
-        coords = feature['geometry']['coordinates']
-        all_coords.extend(coords)
+    # All vertices in one (N, 2) lon/lat array; feature i owns rows
+    # offsets[i]:offsets[i] + lengths[i]
+    feature_coords = [
+        np.asarray(feature['geometry']['coordinates'], dtype=np.float64).reshape(-1, 2)
+        for feature in geojson['features']
+    ]
+    all_coords = np.concatenate(feature_coords)
+    lengths = np.array([len(coords) for coords in feature_coords])
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    spans = list(zip(offsets.tolist(), (offsets + lengths).tolist()))
 
-    min_lon = min(c[0] for c in all_coords)
-    max_lon = max(c[0] for c in all_coords)
-    min_lat = min(c[1] for c in all_coords)
-    max_lat = max(c[1] for c in all_coords)
+    # Calculate bounding box to determine which tiles we need
+    min_lon, min_lat = all_coords.min(axis=0)
+    max_lon, max_lat = all_coords.max(axis=0)
 
     print(f"Bounds: ({min_lat:.4f}, {min_lon:.4f}) to ({max_lat:.4f}, {max_lon:.4f})")
 
-    # Generate tiles for each zoom level
-    for zoom in range(zoom_min, zoom_max + 1):
-        print(f"\nGenerating zoom level {zoom}...")
-
-        # Get tile range
-        min_tile_x, max_tile_y = lon_lat_to_tile(min_lon, min_lat, zoom)
-        max_tile_x, min_tile_y = lon_lat_to_tile(max_lon, max_lat, zoom)
-
-        print(f"  Tiles X: {min_tile_x} to {max_tile_x}")
-        print(f"  Tiles Y: {min_tile_y} to {max_tile_y}")
-
-        # Create zoom directory
-        zoom_dir = output_dir / str(zoom)
-        zoom_dir.mkdir(exist_ok=True)
-
-        # Generate each tile
-        tile_count = 0
-        for tile_x in range(min_tile_x, max_tile_x + 1):
-            x_dir = zoom_dir / str(tile_x)
-            x_dir.mkdir(exist_ok=True)
-
-            for tile_y in range(min_tile_y, max_tile_y + 1):
-                # Create transparent image
-                img = Image.new('RGBA', (tile_size, tile_size), (0, 0, 0, 0))
-                draw = ImageDraw.Draw(img)
+    # Project every vertex once; each zoom level only rescales the result
+    merc = lon_lat_to_mercator(all_coords)
 
-                # Get tile bounds
-                tile_lon_nw, tile_lat_nw = tile_to_lon_lat(tile_x, tile_y, zoom)
-                tile_lon_se, tile_lat_se = tile_to_lon_lat(tile_x + 1, tile_y + 1, zoom)
-
-                # Draw each lift that intersects this tile
-                line_width = get_lift_width(zoom)
-
-                for feature in geojson['features']:
-                    coords = feature['geometry']['coordinates']
-                    lift_type = feature['properties'].get('type', 'chair_lift')
-                    color = get_lift_color(lift_type)
-
-                    # Convert coordinates to pixels
-                    pixels = []
-                    for lon, lat in coords:
-                        # Check if point is near this tile
-                        if (tile_lon_nw - 0.01 <= lon <= tile_lon_se + 0.01 and
-                            tile_lat_se - 0.01 <= lat <= tile_lat_nw + 0.01):
-                            px, py = lon_lat_to_pixel(lon, lat, zoom, tile_x, tile_y, tile_size)
-                            pixels.append((px, py))
-
-                    # Draw line if we have at least 2 points
-                    if len(pixels) >= 2:
-                        draw.line(pixels, fill=color, width=line_width)
-
-                # Save tile
-                tile_path = x_dir / f'{tile_y}.png'
-                img.save(tile_path, 'PNG')
-                tile_count += 1
-
-        print(f"  Generated {tile_count} tiles")
+    # What each lift is drawn with, looked up once: its color for raster tiles,
+    # its non-null attributes for vector tiles
+    if tile_format == 'mvt':
+        feature_styles = [
+            {k: v for k, v in feature['properties'].items() if v is not None}
+            for feature in geojson['features']
+        ]
+    else:
+        feature_styles = [
+            get_lift_color(feature['properties'].get('type', 'chair_lift'))
+            for feature in geojson['features']
+        ]
+
+    # Visvalingam salience of every vertex in squared normalized Mercator units,
+    # computed once and thresholded per zoom
+    salience = np.concatenate([visvalingam_areas(merc[start:end]) for start, end in spans])
+
+    # Generate tiles for each zoom level, one worker task per tile column
+    zoom_columns = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for zoom in range(zoom_min, zoom_max + 1):
+            print(f"\nGenerating zoom level {zoom}...")
+
+            # World pixel coordinates of every vertex, split back into features and
+            # simplified for this zoom. Areas scale with the square of the map size.
+            # Tile (x, y) covers world pixels [x, x + 1) * tile_size by [y, y + 1) * tile_size,
+            # so no per-tile lon/lat bounds are needed.
+            map_size = world_size(zoom, tile_size)
+            world = merc * map_size
+            keep = salience >= SIMPLIFY_AREA / float(map_size) ** 2
+            feature_pixels = [world[start:end][keep[start:end]] for start, end in spans]
+
+            line_width = get_lift_width(zoom)
+            margin = line_width / 2 + 1
+
+            # Walk each lift's segments across the tile grid, collecting per tile the
+            # runs of consecutive vertices [feature, first, last] that cross it
+            tile_runs = defaultdict(list)
+            for i, pixels in enumerate(feature_pixels):
+                points = pixels.tolist()
+                for j in range(len(points) - 1):
+                    (x0, y0), (x1, y1) = points[j], points[j + 1]
+                    for tile in segment_tiles(x0, y0, x1, y1, tile_size, margin):
+                        runs = tile_runs[tile]
+                        if runs and runs[-1][0] == i and runs[-1][2] == j:
+                            runs[-1][2] = j + 1
+                        else:
+                            runs.append([i, j, j + 1])
+
+            if not tile_runs:
+                print("  No lifts to draw")
+                (output_dir / str(zoom)).mkdir(exist_ok=True)
+                zoom_columns[zoom] = []
+                continue
+
+            # Get tile range
+            min_tile_x = min(tile_x for tile_x, _ in tile_runs)
+            max_tile_x = max(tile_x for tile_x, _ in tile_runs)
+            min_tile_y = min(tile_y for _, tile_y in tile_runs)
+            max_tile_y = max(tile_y for _, tile_y in tile_runs)
+
+            print(f"  Tiles X: {min_tile_x} to {max_tile_x}")
+            print(f"  Tiles Y: {min_tile_y} to {max_tile_y}")
+
+            # Create zoom directory
+            zoom_dir = output_dir / str(zoom)
+            zoom_dir.mkdir(exist_ok=True)
+
+            # Convert each run to pixels within its tile, grouped by column so the
+            # workers only receive the flat pixel lists they draw
+            columns = defaultdict(lambda: defaultdict(list))
+            for (tile_x, tile_y), runs in tile_runs.items():
+                origin = (tile_x * tile_size, tile_y * tile_size)
+                for i, first, last in runs:
+                    pixels = feature_pixels[i][first:last + 1] - origin
+                    if tile_format == 'mvt':
+                        # Vector tiles keep subpixel positions
+                        columns[tile_x][tile_y].append((feature_styles[i], pixels.ravel().tolist()))
+                    else:
+                        columns[tile_x][tile_y].append((feature_styles[i], np.floor(pixels).astype(int).ravel().tolist()))
+
+            if tile_format == 'mvt':
+                zoom_columns[zoom] = [
+                    executor.submit(render_vector_column, zoom_dir / str(tile_x), dict(lines), tile_size)
+                    for tile_x, lines in columns.items()
+                ]
+                continue
+
+            zoom_columns[zoom] = [
+                executor.submit(render_tile_column, zoom_dir / str(tile_x), dict(lines), tile_size, line_width, renderer)
+                for tile_x, lines in columns.items()
+            ]
+
+        print()
+        for zoom, futures in zoom_columns.items():
+            tile_count = sum(future.result() for future in futures)
+            write_tiles([(output_dir / str(zoom) / ZOOM_COMPLETE_MARKER.format(tile_format), b'')])
+            print(f"Zoom {zoom}: generated {tile_count} tiles")
+
+    # Optional lossless recompression of the PNGs
+    if oxipng and tile_format == 'png':
+        if shutil.which('oxipng') is None:
+            print("\nWarning: oxipng not found on PATH, skipping PNG optimization")
+        else:
+            print("\nOptimizing PNGs with oxipng...")
+            subprocess.run(['oxipng', '-o', '4', '--strip', 'all', '--quiet', '--recursive', str(output_dir)], check=True)
 
     print(f"\nDone! Tiles saved to {output_dir}")
     print(f"\nTile URL template:")
-    print(f"  /tiles/{mountain_id}/{{z}}/{{x}}/{{y}}.png")
+    extension = 'mvt.gz' if tile_format == 'mvt' else 'png'
+    print(f"  /tiles/{mountain_id}/{{z}}/{{x}}/{{y}}.{extension}")
 
 
 def main():
@@ -184,6 +522,12 @@ def main():
     parser.add_argument('--zoom-min', type=int, default=10, help='Minimum zoom level (default: 10)')
     parser.add_argument('--zoom-max', type=int, default=16, help='Maximum zoom level (default: 16)')
     parser.add_argument('--tile-size', type=int, default=256, help='Tile size in pixels (default: 256)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--format', choices=['png', 'mvt'], default='png',
+                        help='png raster tiles or gzipped Mapbox Vector Tiles (default: png)')
+    parser.add_argument('--renderer', choices=['pillow', 'skia'], default='pillow',
+                        help='Draw PNG tiles with Pillow or anti-aliased with skia-python (default: pillow)')
+    parser.add_argument('--oxipng', action='store_true', help='Recompress PNG tiles with oxipng if installed')
 
     args = parser.parse_args()
 
@@ -191,7 +535,11 @@ def main():
         mountain_id=args.mountain_id,
         zoom_min=args.zoom_min,
         zoom_max=args.zoom_max,
-        tile_size=args.tile_size
+        tile_size=args.tile_size,
+        workers=args.workers,
+        tile_format=args.format,
+        oxipng=args.oxipng,
+        renderer=args.renderer
     )
 
 
@@ -4,38 +4,42 @@ Generate a professional app icon for PowderTracker/Shredders
 Design: Mountain peak with powder snow and dynamic ski trail
 """
 
+from pathlib import Path
+import hashlib
+
 from PIL import Image, ImageDraw, ImageFont
-import math
+import numpy as np
 
 def create_icon(size=1024):
-    # Create image with dark blue background
+    # Scale factor for responsive design; the 1024 master is drawn unscaled
+    s = size / 1024
+    if size == 1024:
+        def scaled(v):
+            return v
+    else:
+        def scaled(v):
+            return int(v * s)
+
+    # Background gradient (dark to slightly lighter blue), built as one array
     base_color = (26, 35, 50)  # #1a2332
-    img = Image.new('RGB', (size, size), base_color)
+    gradient_factor = np.arange(size, dtype=np.float64)[:, None] / size
+    rows = (np.array(base_color, dtype=np.float64) + 20 * gradient_factor).astype(np.uint8)
+    pixels = np.broadcast_to(rows[:, None, :], (size, size, 3)).copy()
+    img = Image.fromarray(pixels, 'RGB')
     draw = ImageDraw.Draw(img, 'RGBA')
 
-    # Scale factor for responsive design
-    s = size / 1024
-
-    # Background gradient (dark to slightly lighter blue)
-    for y in range(size):
-        gradient_factor = y / size
-        r = int(base_color[0] + 20 * gradient_factor)
-        g = int(base_color[1] + 20 * gradient_factor)
-        b = int(base_color[2] + 20 * gradient_factor)
-        draw.rectangle([(0, y), (size, y+1)], fill=(r, g, b))
-
     # Main mountain (large, centered)
-    mountain_base_y = int(750 * s)
-    mountain_peak = (size // 2, int(200 * s))
-    mountain_left = (int(200 * s), mountain_base_y)
-    mountain_right = (int(824 * s), mountain_base_y)
+    mountain_base_y = scaled(750)
+    mountain_peak = (size // 2, scaled(200))
+    mountain_left = (scaled(200), mountain_base_y)
+    mountain_right = (scaled(824), mountain_base_y)
 
     # Mountain layers for depth
     # Back mountain (darker)
     back_mountain = [
-        (int(280 * s), mountain_base_y),
-        (int(450 * s), int(280 * s)),
-        (int(620 * s), mountain_base_y)
+        (scaled(280), mountain_base_y),
+        (scaled(450), scaled(280)),
+        (scaled(620), mountain_base_y)
     ]
     draw.polygon(back_mountain, fill='#2c4a7c')
 
@@ -45,75 +49,102 @@ def create_icon(size=1024):
 
     # Snow cap on peak (crisp white)
     snow_cap = [
-        (mountain_peak[0] - int(120 * s), int(350 * s)),
+        (mountain_peak[0] - scaled(120), scaled(350)),
         mountain_peak,
-        (mountain_peak[0] + int(120 * s), int(350 * s)),
-        (mountain_peak[0] + int(80 * s), int(380 * s)),
-        (mountain_peak[0] - int(80 * s), int(380 * s))
+        (mountain_peak[0] + scaled(120), scaled(350)),
+        (mountain_peak[0] + scaled(80), scaled(380)),
+        (mountain_peak[0] - scaled(80), scaled(380))
     ]
     draw.polygon(snow_cap, fill='#ffffff')
 
     # Snow texture on mountain (lighter blue areas)
     left_snow = [
-        (int(280 * s), int(500 * s)),
-        (int(380 * s), int(400 * s)),
-        (int(420 * s), int(520 * s))
+        (scaled(280), scaled(500)),
+        (scaled(380), scaled(400)),
+        (scaled(420), scaled(520))
     ]
     draw.polygon(left_snow, fill='#6ba3d0')
 
     # Dynamic ski trail (vibrant green/cyan curve)
     # Draw thick curved line representing fresh tracks
-    trail_points = []
-    start_x = int(720 * s)
-    start_y = int(380 * s)
+    start_x = scaled(720)
+    start_y = scaled(380)
 
-    for i in range(50):
-        t = i / 49
-        # Bezier-like curve
-        x = start_x - int(300 * s * t)
-        y = start_y + int(300 * s * t) + int(50 * s * math.sin(t * math.pi * 2))
-        trail_points.append((x, y))
+    # Bezier-like curve, sampled at 50 points into an (N, 2) array
+    t = np.arange(50) / 49
+    xs = start_x - (300 * s * t).astype(np.int64)
+    ys = start_y + (300 * s * t).astype(np.int64) + (50 * s * np.sin(t * np.pi * 2)).astype(np.int64)
+    trail_points = np.stack([xs, ys], axis=1)
 
     # Draw trail with varying width
-    for i in range(len(trail_points) - 1):
-        width = int((15 - i * 0.15) * s)
-        if width < int(3 * s):
-            width = int(3 * s)
+    seg = np.arange(len(trail_points) - 1)
+    widths = np.maximum((15 - seg * 0.15) * s, scaled(3)).astype(np.int64)
+
+    # Gradient from bright green to cyan
+    green_val = 230 - (seg * 1.5).astype(np.int64)
+    blue_val = 100 + seg * 2
+    colors = np.where(
+        (green_val > 100)[:, None],
+        np.stack([green_val, np.full_like(seg, 200), blue_val], axis=1),
+        np.array([61, 214, 140]),
+    ).astype(np.uint8)
 
-        # Gradient from bright green to cyan
-        green_val = 230 - int(i * 1.5)
-        blue_val = 100 + int(i * 2)
-        color = (green_val, 200, blue_val) if green_val > 100 else (61, 214, 140)
-
-        draw.line([trail_points[i], trail_points[i+1]], fill=color, width=width)
+    for i in range(len(trail_points) - 1):
+        draw.line([tuple(p) for p in trail_points[i:i + 2].tolist()],
+                  fill=tuple(colors[i].tolist()), width=int(widths[i]))
 
     # Add subtle shadow/depth to mountain
-    shadow_overlay = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    shadow_draw = ImageDraw.Draw(shadow_overlay)
-
+    # The RGBA draw context blends the translucent fill straight onto the image
     # Right side shadow
     shadow_polygon = [
         mountain_peak,
         mountain_right,
         (mountain_peak[0], mountain_base_y)
     ]
-    shadow_draw.polygon(shadow_polygon, fill=(0, 0, 0, 40))
-    img.paste(Image.alpha_composite(img.convert('RGBA'), shadow_overlay).convert('RGB'))
-
-    # Optional: Add powder spray effect (small dots near trail)
-    for i in range(30):
-        px = int((650 - i * 8) * s + (i % 3) * 10 * s)
-        py = int((450 + i * 6) * s + (i % 2) * 15 * s)
-        radius = int((3 - i * 0.05) * s)
-        if radius > 0:
-            alpha = 200 - i * 6
-            draw.ellipse([(px-radius, py-radius), (px+radius, py+radius)],
-                        fill=(200, 240, 220, alpha))
+    draw.polygon(shadow_polygon, fill=(0, 0, 0, 40))
+
+    # Optional: Add powder spray effect (small dots near trail), stamped into
+    # the pixel buffer through one precomputed disk mask
+    i = np.arange(30)
+    spray_x = ((650 - i * 8) * s + (i % 3) * 10 * s).astype(np.int64)
+    spray_y = ((450 + i * 6) * s + (i % 2) * 15 * s).astype(np.int64)
+    spray_radius = ((3 - i * 0.05) * s).astype(np.int64)
+    spray_alpha = (200 - i * 6) / 255
+
+    max_radius = max(int(spray_radius.max()), 0)
+    yy, xx = np.mgrid[-max_radius:max_radius + 1, -max_radius:max_radius + 1]
+    dist2 = yy ** 2 + xx ** 2
+    powder = np.array([200, 240, 220], dtype=np.float64)
+
+    pixels = np.array(img)
+    for px, py, radius, alpha in zip(spray_x, spray_y, spray_radius, spray_alpha):
+        if radius <= 0:
+            continue
+        lo, hi = max_radius - radius, max_radius + radius + 1
+        disk = (dist2[lo:hi, lo:hi] < radius * (radius + 1))[:, :, None] * alpha
+        patch = pixels[py - radius:py + radius + 1, px - radius:px + radius + 1]
+        patch[...] = np.rint(patch + (powder - patch) * disk)
+    img = Image.fromarray(pixels, 'RGB')
 
     return img
 
+def render_icon(path, size=1024):
+    """Render the icon to path, skipping the work if the sidecar hash still matches"""
+    # Keyed on this script's source and the size, so any drawing change re-renders
+    path = Path(path)
+    key = hashlib.sha256(Path(__file__).read_bytes() + f':{size}'.encode()).hexdigest()
+    sidecar = path.with_name(path.name + '.sha256')
+
+    if path.exists() and sidecar.exists() and sidecar.read_text().strip() == key:
+        return False
+
+    create_icon(size).save(path, 'PNG', quality=100)
+    sidecar.write_text(key + '\n')
+    return True
+
 if __name__ == '__main__':
     print("Generating PowderTracker app icon...")
-    icon = create_icon(1024)
-    icon.save('/Users/kevin/Downloads/shredders/logo_master.png', 'PNG', quality=100)
-    print("✓ Master icon saved: logo_master.png (1024x1024)")
+    if render_icon('/Users/kevin/Downloads/shredders/logo_master.png', 1024):
+        print("✓ Master icon saved: logo_master.png (1024x1024)")
+    else:
+        print("✓ Master icon up to date: logo_master.png (1024x1024)")
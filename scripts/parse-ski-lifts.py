@@ -1,14 +1,33 @@
 #!/usr/bin/env python3
 """
-Parse planet_pistes.osm and extract ski lift coordinates for each mountain.
+Parse planet_pistes.osm (or planet_pistes.osm.pbf, via pyosmium) and extract
+ski lift coordinates for each mountain.
 Generates individual GeoJSON files per mountain.
 """
 
-import xml.etree.ElementTree as ET
-import json
 import sys
+from array import array
 from collections import defaultdict
 
+import numpy as np
+import orjson
+from lxml import etree
+
+try:
+    import geobuf
+except ImportError:  # geobuf is optional; only the .geojson files are written without it
+    geobuf = None
+
+try:
+    import osmium
+except ImportError:  # pyosmium is only needed for .osm.pbf input
+    osmium = None
+
+try:
+    from shapely import STRtree, box
+except ImportError:  # shapely is optional; every mountain is checked without it
+    STRtree = None
+
 # Mountain configurations with bounding boxes (approx 5km radius)
 MOUNTAINS = {
     'baker': {
@@ -33,113 +52,162 @@ MOUNTAINS = {
     },
 }
 
-def is_in_bbox(lat, lon, bbox):
-    """Check if coordinate is within bounding box."""
-    min_lat, min_lon, max_lat, max_lon = bbox
-    return min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
+SKIP_TYPES = {'station', 'zip_line', 'goods'}
+
+# Spatial index over the mountain bboxes; tree index i is MOUNTAIN_IDS[i]
+# and row i of MOUNTAIN_BBOXES is its (min_lat, min_lon, max_lat, max_lon)
+MOUNTAIN_IDS = list(MOUNTAINS)
+MOUNTAIN_BBOXES = np.array([MOUNTAINS[mountain_id]['bbox'] for mountain_id in MOUNTAIN_IDS], dtype=np.float64)
+MOUNTAIN_TREE = STRtree([
+    box(min_lon, min_lat, max_lon, max_lat)
+    for min_lat, min_lon, max_lat, max_lon in (MOUNTAINS[mountain_id]['bbox'] for mountain_id in MOUNTAIN_IDS)
+]) if STRtree else None
+
+def candidate_mountains(points):
+    """Indices of the mountains whose bbox intersects the bbox of (N, 2) lat/lon points, in MOUNTAINS order."""
+    if MOUNTAIN_TREE is None:
+        return np.arange(len(MOUNTAIN_IDS))
+    min_lat, min_lon = points.min(axis=0)
+    max_lat, max_lon = points.max(axis=0)
+    return np.sort(MOUNTAIN_TREE.query(box(min_lon, min_lat, max_lon, max_lat), predicate='intersects'))
+
+def is_lift(way_tags):
+    """Aerialways other than stations, zip lines and goods lifts."""
+    aerialway_type = way_tags.get('aerialway')
+    return aerialway_type is not None and aerialway_type not in SKIP_TYPES
+
+def add_lift(mountain_lifts, way_id, way_tags, coords):
+    """
+    Append a lift way with (lat, lon) coords to the first mountain whose bbox
+    contains any of its coordinates. Returns True if it was assigned.
+    """
+    # Check which mountain(s) this lift belongs to, among those whose bbox
+    # overlaps the lift's: one (vertices x candidates) containment test
+    points = np.asarray(coords, dtype=np.float64)
+    candidates = candidate_mountains(points)
+    bboxes = MOUNTAIN_BBOXES[candidates]
+    lats, lons = points[:, 0:1], points[:, 1:2]
+    inside = (
+        (lats >= bboxes[:, 0]) & (lats <= bboxes[:, 2]) &
+        (lons >= bboxes[:, 1]) & (lons <= bboxes[:, 3])
+    ).any(axis=0)
+
+    # Each lift only assigned to one mountain, the first that contains any coordinate
+    if not inside.any():
+        return False
+
+    mountain_id = MOUNTAIN_IDS[candidates[inside.argmax()]]
+    lift_feature = {
+        'type': 'Feature',
+        'geometry': {
+            'type': 'LineString',
+            'coordinates': [[lon, lat] for lat, lon in coords]  # GeoJSON: [lon, lat]
+        },
+        'properties': {
+            'id': way_id,
+            'type': way_tags['aerialway'],
+            'name': way_tags.get('name', f'Lift {way_id}'),
+            'occupancy': way_tags.get('aerialway:occupancy'),
+            'capacity': way_tags.get('aerialway:capacity'),
+            'duration': way_tags.get('aerialway:duration'),
+            'heating': way_tags.get('aerialway:heating'),
+            'bubble': way_tags.get('aerialway:bubble'),
+        }
+    }
+    mountain_lifts[mountain_id].append(lift_feature)
+    return True
 
 def parse_osm_file(osm_file):
     """
-    Parse OSM file and extract lift data for each mountain.
+    Parse OSM XML file and extract lift data for each mountain.
     Returns dict of {mountain_id: [lift_features]}
     """
     print(f"🔍 Parsing {osm_file}...")
 
-    # Storage for nodes and lifts
-    nodes = {}  # node_id -> (lat, lon)
+    # Storage for nodes and lifts. Node coordinates are packed into two double
+    # arrays, indexed through an int node id -> position map, instead of a
+    # tuple of floats per node keyed by its id string
+    node_index = {}  # node_id -> index into node_lats / node_lons
+    node_lats = array('d')
+    node_lons = array('d')
     mountain_lifts = defaultdict(list)  # mountain_id -> [lifts]
 
-    # Parse in chunks to handle large file
-    context = ET.iterparse(osm_file, events=('start', 'end'))
-    context = iter(context)
-    event, root = next(context)
+    # Stream only complete node and way elements; a way's nd and tag children
+    # are read from the element itself when its end event arrives
+    context = etree.iterparse(osm_file, events=('end',), tag=('node', 'way', 'relation'), huge_tree=True)
 
     way_count = 0
     lift_count = 0
-    current_way = None
-    current_way_nodes = []
-    current_way_tags = {}
 
     for event, elem in context:
-        if event == 'start':
-            continue
-
         # Process nodes
         if elem.tag == 'node':
-            node_id = elem.get('id')
-            lat = float(elem.get('lat'))
-            lon = float(elem.get('lon'))
-            nodes[node_id] = (lat, lon)
-            elem.clear()
+            node_index[int(elem.get('id'))] = len(node_lats)
+            node_lats.append(float(elem.get('lat')))
+            node_lons.append(float(elem.get('lon')))
 
-        # Process ways (potential lifts)
+        # Process ways (potential lifts); relations are only matched so they get freed
         elif elem.tag == 'way':
-            if current_way is not None:
-                # Check if this way is a lift
-                if 'aerialway' in current_way_tags:
-                    aerialway_type = current_way_tags['aerialway']
-
-                    # Skip stations and zip lines
-                    if aerialway_type not in ['station', 'zip_line', 'goods']:
-                        # Get coordinates for this way
-                        coords = []
-                        for node_ref in current_way_nodes:
-                            if node_ref in nodes:
-                                coords.append(nodes[node_ref])
-
-                        if coords:
-                            # Check which mountain(s) this lift belongs to
-                            for mountain_id, mountain_config in MOUNTAINS.items():
-                                # Check if any coordinate is in this mountain's bbox
-                                if any(is_in_bbox(lat, lon, mountain_config['bbox']) for lat, lon in coords):
-                                    lift_feature = {
-                                        'type': 'Feature',
-                                        'geometry': {
-                                            'type': 'LineString',
-                                            'coordinates': [[lon, lat] for lat, lon in coords]  # GeoJSON: [lon, lat]
-                                        },
-                                        'properties': {
-                                            'id': current_way,
-                                            'type': aerialway_type,
-                                            'name': current_way_tags.get('name', f'Lift {current_way}'),
-                                            'occupancy': current_way_tags.get('aerialway:occupancy'),
-                                            'capacity': current_way_tags.get('aerialway:capacity'),
-                                            'duration': current_way_tags.get('aerialway:duration'),
-                                            'heating': current_way_tags.get('aerialway:heating'),
-                                            'bubble': current_way_tags.get('aerialway:bubble'),
-                                        }
-                                    }
-                                    mountain_lifts[mountain_id].append(lift_feature)
-                                    lift_count += 1
-                                    break  # Each lift only assigned to one mountain
-
-            # Start new way
-            current_way = elem.get('id')
-            current_way_nodes = []
-            current_way_tags = {}
+            way_tags = {tag.get('k'): tag.get('v') for tag in elem.iterfind('tag')}
             way_count += 1
 
-            if way_count % 10000 == 0:
-                print(f"  Processed {way_count:,} ways, found {lift_count} lifts...")
+            if is_lift(way_tags):
+                # Get coordinates for this way
+                coords = []
+                for nd in elem.iterfind('nd'):
+                    i = node_index.get(int(nd.get('ref')))
+                    if i is not None:
+                        coords.append((node_lats[i], node_lons[i]))
 
-            elem.clear()
+                if coords and add_lift(mountain_lifts, elem.get('id'), way_tags, coords):
+                    lift_count += 1
 
-        # Process way nodes
-        elif elem.tag == 'nd' and current_way is not None:
-            current_way_nodes.append(elem.get('ref'))
-            elem.clear()
+            if way_count % 10000 == 0:
+                print(f"  Processed {way_count:,} ways, found {lift_count} lifts...")
 
-        # Process way tags
-        elif elem.tag == 'tag' and current_way is not None:
-            k = elem.get('k')
-            v = elem.get('v')
-            current_way_tags[k] = v
-            elem.clear()
+        # Free the element and the already-processed siblings before it
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
 
-    root.clear()
     print(f"✅ Parsing complete! Found {lift_count} lifts across {len(mountain_lifts)} mountains")
     return mountain_lifts
 
+class LiftHandler(osmium.SimpleHandler if osmium else object):
+    """Collects lift ways from an OSM PBF file; osmium resolves node locations."""
+
+    def __init__(self):
+        super().__init__()
+        self.mountain_lifts = defaultdict(list)  # mountain_id -> [lifts]
+        self.way_count = 0
+        self.lift_count = 0
+
+    def way(self, w):
+        self.way_count += 1
+
+        if 'aerialway' in w.tags:
+            way_tags = {tag.k: tag.v for tag in w.tags}
+            if is_lift(way_tags):
+                coords = [(n.lat, n.lon) for n in w.nodes if n.location.valid()]
+                if coords and add_lift(self.mountain_lifts, str(w.id), way_tags, coords):
+                    self.lift_count += 1
+
+        if self.way_count % 10000 == 0:
+            print(f"  Processed {self.way_count:,} ways, found {self.lift_count} lifts...")
+
+def parse_osm_pbf(osm_file):
+    """
+    Parse an .osm.pbf file with pyosmium and extract lift data for each mountain.
+    Returns dict of {mountain_id: [lift_features]}
+    """
+    print(f"🔍 Parsing {osm_file}...")
+
+    handler = LiftHandler()
+    handler.apply_file(osm_file, locations=True)
+
+    print(f"✅ Parsing complete! Found {handler.lift_count} lifts across {len(handler.mountain_lifts)} mountains")
+    return handler.mountain_lifts
+
 def generate_geojson_files(mountain_lifts, output_dir='./geojson'):
     """Generate individual GeoJSON files for each mountain."""
     import os
@@ -162,8 +230,11 @@ def generate_geojson_files(mountain_lifts, output_dir='./geojson'):
         }
 
         output_file = os.path.join(output_dir, f'{mountain_id}.geojson')
-        with open(output_file, 'w') as f:
-            json.dump(geojson, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(geojson))
+        if geobuf is not None:
+            with open(f'{output_file}.pbf', 'wb') as f:
+                f.write(geobuf.encode(geojson, 6, 2))  # 6 decimal places, 2D
 
         print(f"  ✅ {mountain_id}: {len(lifts)} lifts -> {output_file}")
 
@@ -177,7 +248,13 @@ def main():
     print("=" * 50)
 
     # Parse OSM file
-    mountain_lifts = parse_osm_file(osm_file)
+    if osm_file.endswith('.pbf'):
+        if osmium is None:
+            print("❌ Reading .osm.pbf files requires pyosmium (pip install osmium)")
+            sys.exit(1)
+        mountain_lifts = parse_osm_pbf(osm_file)
+    else:
+        mountain_lifts = parse_osm_file(osm_file)
 
     # Generate GeoJSON files
     print("\n📝 Generating GeoJSON files...")
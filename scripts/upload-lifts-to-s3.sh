@@ -29,6 +29,18 @@ for file in "$LOCAL_DIR"/*.geojson; do
     fi
 done
 
+# Upload geobuf companions written alongside the GeoJSON, if any
+for file in "$LOCAL_DIR"/*.geojson.pbf; do
+    if [ -f "$file" ]; then
+        filename=$(basename "$file")
+        echo "📤 Uploading $filename..."
+        aws s3 cp "$file" "s3://$BUCKET/$S3_PREFIX/$filename" \
+            --content-type "application/x-protobuf" \
+            --acl public-read \
+            --cache-control "max-age=86400"
+    fi
+done
+
 echo ""
 echo "✅ Upload complete!"
 echo "Files available at:"